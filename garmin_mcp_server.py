@@ -3,14 +3,31 @@ Modular MCP Server for Garmin Connect Data
 """
 
 import asyncio
+import contextlib
 import time
 import os
+import tempfile
 import datetime
+import importlib
+import logging
+import logging.handlers
+import queue
 import requests
-import threading
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from mcp.server.fastmcp import FastMCP
 
 # Load environment variables from .env file
@@ -20,210 +37,506 @@ load_dotenv(dotenv_path=env_path)
 from garth.exc import GarthHTTPError
 from garminconnect import Garmin, GarminConnectAuthenticationError
 
-# Import all modules
-from modules import activity_management
-from modules import health_wellness
-from modules import user_profile
-from modules import devices
-from modules import gear_management
-from modules import weight_management
-from modules import challenges
-from modules import training
-from modules import workouts
-from modules import data_management
-from modules import womens_health
+from modules.executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Tool modules, imported by register_all_tools() once serve() has the Garmin
+# client ready, rather than at server import time
+_MODULE_NAMES = (
+    "activity_management",
+    "health_wellness",
+    "user_profile",
+    "devices",
+    "gear_management",
+    "weight_management",
+    "challenges",
+    "training",
+    "workouts",
+    "data_management",
+    "womens_health",
+)
 
 # Get credentials from environment
 email = os.environ.get("GARMIN_EMAIL")
 password = os.environ.get("GARMIN_PASSWORD")
-tokenstore = os.getenv("GARMINTOKENS") or "~/.garminconnect"
-tokenstore_base64 = os.getenv("GARMINTOKENS_BASE64") or "~/.garminconnect_base64"
+# Token locations are resolved once here rather than on every login attempt
+tokenstore = os.path.expanduser(os.getenv("GARMINTOKENS") or "~/.garminconnect")
+tokenstore_base64 = os.path.expanduser(
+    os.getenv("GARMINTOKENS_BASE64") or "~/.garminconnect_base64"
+)
+# Set GARMIN_MFA=0 for accounts without MFA to log in synchronously at startup
+ENABLE_MFA = os.getenv("GARMIN_MFA", "1") == "1"
 
 LOGIN_STATE_SUCCESS = 0
 LOGIN_STATE_MFA = 1
 LOGIN_STATE_ERROR = 2
 login_state = None
-need_mfa = None
-mfa_code = None
-lock = threading.Lock()
+# MFA signalling lives on the server's event loop; the login runs in an
+# executor thread and hands control back to the loop when it needs a code
+event_loop = None
+mfa_needed_event = asyncio.Event()
+login_done_event = asyncio.Event()
+mfa_code_future = None
+MFA_TIMEOUT = 1800
+# How long startup waits for the login to either finish or ask for MFA
+LOGIN_TIMEOUT = 60
 
-def init_api(email, password):
-    """Initialize Garmin API with your credentials."""
+# Per-activity block of the list_activities output
+_ACTIVITY_TEMPLATE = "--- Activity {idx} ---\nActivity: {name}\nType: {type}\nDate: {date}\nID: {aid}\n\n"
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks = set()
+
+# Rendered list_activities output, keyed by limit: (timestamp, result)
+_activities_cache = {}
+_ACTIVITIES_TTL = 30.0
 
+# Refresh stored OAuth2 tokens that expire within this many seconds
+TOKEN_REFRESH_MARGIN = 300
+# File descriptor of the cross-process login lock while this process holds it
+_login_lock_fd = None
+# Written to the lock file while its holder waits for the user's MFA code
+LOGIN_LOCK_MFA = b"mfa"
+
+@contextlib.contextmanager
+def token_lock(path):
+    """Hold an exclusive lock on `path`.lock while token files are written"""
+    if fcntl is None:
+        yield
+        return
+    lock_fd = os.open(path + ".lock", os.O_CREAT | os.O_RDWR)
     try:
-        # Using Oauth1 and OAuth2 token files from directory
-        print(
-            f"Trying to login to Garmin Connect using token data from directory '{tokenstore}'...\n"
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(lock_fd)
+
+def write_token_file(path, data):
+    """Atomically replace the file at `path` with `data`"""
+    with token_lock(path):
+        # A unique temp file per writer, so writes stay atomic even without fcntl
+        tmp_fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=os.path.basename(path) + "."
         )
+        try:
+            with os.fdopen(tmp_fd, "w") as token_file:
+                token_file.write(data)
+                token_file.flush()
+                os.fsync(token_file.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
+
+def dump_tokens(garmin, path):
+    """Save the OAuth token files to directory `path` without ever leaving
+    a partially written token file behind"""
+    os.makedirs(path, exist_ok=True)
+    with token_lock(path):
+        with tempfile.TemporaryDirectory(dir=path) as shadow_dir:
+            garmin.garth.dump(shadow_dir)
+            for name in os.listdir(shadow_dir):
+                os.replace(os.path.join(shadow_dir, name), os.path.join(path, name))
+
+def save_tokens(garmin):
+    """Store the client's OAuth tokens in both the token directory and the base64 token file"""
+    # Save Oauth1 and Oauth2 token files to directory for next login
+    dump_tokens(garmin, tokenstore)
+    logger.info(
+        f"Oauth tokens stored in '{tokenstore}' directory for future use. (first method)"
+    )
+    # Encode Oauth1 and Oauth2 tokens to base64 string and safe to file for next login (alternative way)
+    token_base64 = garmin.garth.dumps()
+    write_token_file(tokenstore_base64, token_base64)
+    logger.info(
+        f"Oauth tokens encoded as base64 string and saved to '{tokenstore_base64}' file for future use. (second method)"
+    )
+
+def load_tokens(garmin, path, encoded):
+    """Load OAuth tokens from the token directory at `path`, or from the
+    base64 token file at `path` when `encoded`.
+
+    Truncated or garbled token data is reported as FileNotFoundError, so
+    callers treat it like missing tokens and fall back to the next option.
+    """
+    try:
+        if encoded:
+            with open(path, "r") as token_file:
+                garmin.garth.loads(token_file.read())
+        else:
+            garmin.garth.load(path)
+    except (ValueError, TypeError, KeyError) as err:
+        logger.warning(f"Ignoring unreadable Garmin Connect tokens in '{path}': {err}")
+        raise FileNotFoundError(path) from err
+
+def login_with_tokens(path, encoded=False):
+    """Log in with the OAuth tokens stored at `path`, see load_tokens"""
+    garmin = Garmin()
+    configure_session(garmin)
+    load_tokens(garmin, path, encoded)
+    if tokens_need_refresh(garmin):
+        refresh_tokens(garmin, path, encoded)
+    garmin.login(garmin.garth.dumps())
+    return garmin
+
+def tokens_need_refresh(garmin):
+    """Whether the client's OAuth2 token is expired or about to expire"""
+    return garmin.garth.oauth2_token.expires_at - time.time() < TOKEN_REFRESH_MARGIN
+
+def refresh_tokens(garmin, path, encoded):
+    """Refresh the client's OAuth2 token once and persist the result, otherwise
+    garth refreshes the stale token again on every server start.
+
+    Runs under the login lock so processes sharing the token store refresh it
+    only once; the others pick up the refreshed tokens from disk. Only the
+    source the client was loaded from (see load_tokens) is re-read, so good
+    base64 tokens aren't swapped for the directory ones that just failed.
+    """
+    already_locked = _login_lock_fd is not None
+    if not already_locked:
+        try:
+            lock_login()
+        except TimeoutError:
+            # garth will refresh the token itself on the first API request
+            logger.warning("Timed out waiting for another process to refresh the OAuth tokens")
+            return
+    try:
+        # Another process may have refreshed the tokens while we waited
+        try:
+            load_tokens(garmin, path, encoded)
+        except FileNotFoundError:
+            pass
+        if tokens_need_refresh(garmin):
+            logger.info("Stored OAuth2 token is expired or about to expire, refreshing it...")
+            garmin.garth.refresh_oauth2()
+            save_tokens(garmin)
+    finally:
+        if not already_locked:
+            unlock_login()
 
+def login_with_stored_tokens():
+    """Log in with the token directory, falling back to the base64 token file"""
+    try:
+        # Using Oauth1 and OAuth2 token files from directory
+        logger.info(
+            f"Trying to login to Garmin Connect using token data from directory '{tokenstore}'..."
+        )
+        return login_with_tokens(tokenstore)
+    except (FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError):
         # Using Oauth1 and Oauth2 tokens from base64 encoded string
-        # print(
-        #     f"Trying to login to Garmin Connect using token data from file '{tokenstore_base64}'...\n"
-        # )
-        # dir_path = os.path.expanduser(tokenstore_base64)
-        # with open(dir_path, "r") as token_file:
-        #     tokenstore = token_file.read()
+        logger.info(
+            f"Trying to login to Garmin Connect using token data from file '{tokenstore_base64}'..."
+        )
+        return login_with_tokens(tokenstore_base64, encoded=True)
 
-        garmin = Garmin()
-        garmin.login(tokenstore)
+def lock_login(timeout=None):
+    """Take the lock that serializes logins and token refreshes between server
+    processes sharing the token store.
+
+    Polls for up to `timeout` seconds (LOGIN_TIMEOUT by default) and raises
+    TimeoutError if the lock is still held elsewhere. Returns whether another
+    process was holding the lock when we asked for it.
+    """
+    global _login_lock_fd
+    if fcntl is None:
+        return False
+    if timeout is None:
+        timeout = LOGIN_TIMEOUT
+    deadline = time.monotonic() + timeout
+    lock_fd = os.open(tokenstore + ".login.lock", os.O_CREAT | os.O_RDWR)
+    contended = False
+    while True:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            _login_lock_fd = lock_fd
+            return contended
+        except BlockingIOError:
+            contended = True
+            if time.monotonic() >= deadline:
+                reason = os.pread(lock_fd, 64, 0)
+                os.close(lock_fd)
+                if reason == LOGIN_LOCK_MFA:
+                    raise TimeoutError(
+                        "Another server process is completing MFA for the Garmin Connect login, "
+                        "enter the code there and then restart this server"
+                    )
+                raise TimeoutError("Timed out waiting for another server process to log in to Garmin Connect")
+            time.sleep(0.1)
+
+def mark_login_lock(reason):
+    """Record in the lock file why this process is holding the login lock"""
+    if _login_lock_fd is None:
+        return
+    os.ftruncate(_login_lock_fd, 0)
+    os.pwrite(_login_lock_fd, reason, 0)
+
+def unlock_login():
+    """Release the lock taken by lock_login, if this process holds it"""
+    global _login_lock_fd
+    lock_fd, _login_lock_fd = _login_lock_fd, None
+    if lock_fd is None:
+        return
+    os.ftruncate(lock_fd, 0)
+    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    os.close(lock_fd)
+
+async def init_api(email, password):
+    """Initialize Garmin API with your credentials."""
+
+    try:
+        garmin = await run_blocking(login_with_stored_tokens)
 
     except (FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError):
+        # Only one process sharing the token store logs in with credentials,
+        # the others wait for it and then log in with the tokens it saved
+        try:
+            await run_blocking(lock_login)
+        except TimeoutError as err:
+            logger.error(str(err))
+            return LOGIN_STATE_ERROR, None
+        # Check again under the lock: another process may have finished its
+        # login after our first attempt, even if the lock looked free
+        try:
+            garmin = await run_blocking(login_with_stored_tokens)
+            unlock_login()
+            return LOGIN_STATE_SUCCESS, garmin
+        except (FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError):
+            pass
+
         # Session is expired. You'll need to log in again
-        print(
-            "Login tokens not present, login with your Garmin Connect credentials to generate them.\n"
-            f"They will be stored in '{tokenstore}' for future use.\n"
-        )
+        if not email or not password:
+            unlock_login()
+            logger.error(
+                "Login tokens not present and GARMIN_EMAIL/GARMIN_PASSWORD are not set, "
+                "cannot log in to Garmin Connect."
+            )
+            return LOGIN_STATE_ERROR, None
 
-        garmin = Garmin(
-            email=email, password=password, is_cn=False, prompt_mfa=get_mfa
+        logger.info(
+            "Login tokens not present, login with your Garmin Connect credentials to generate them. "
+            f"They will be stored in '{tokenstore}' for future use."
         )
 
+        if ENABLE_MFA:
+            garmin = Garmin(
+                email=email, password=password, is_cn=False, prompt_mfa=get_mfa
+            )
+        else:
+            garmin = Garmin(email=email, password=password, is_cn=False)
+        configure_session(garmin)
+
         def login():
             global login_state
             try:
-                print("Logging in...")
+                logger.info("Logging in...")
                 garmin.login()
-            
-                # Save Oauth1 and Oauth2 token files to directory for next login
-                garmin.garth.dump(tokenstore)
-                print(
-                    f"Oauth tokens stored in '{tokenstore}' directory for future use. (first method)\n"
-                )
-                # Encode Oauth1 and Oauth2 tokens to base64 string and safe to file for next login (alternative way)
-                token_base64 = garmin.garth.dumps()
-                dir_path = os.path.expanduser(tokenstore_base64)
-                with open(dir_path, "w") as token_file:
-                    token_file.write(token_base64)
-                print(
-                    f"Oauth tokens encoded as base64 string and saved to '{dir_path}' file for future use. (second method)\n"
-                )
-                
-                with lock:
-                    login_state = LOGIN_STATE_SUCCESS
+                save_tokens(garmin)
+                login_state = LOGIN_STATE_SUCCESS
             except (
                 FileNotFoundError,
                 GarthHTTPError,
                 GarminConnectAuthenticationError,
                 requests.exceptions.HTTPError,
             ) as err:
-                print(err)
-                with lock:
-                    login_state = LOGIN_STATE_ERROR
+                logger.error(err)
+                login_state = LOGIN_STATE_ERROR
+            except Exception:
+                # e.g. the MFA code never arrived; anything else would leave
+                # enter_mfa_code waiting on a login that will never finish
+                logger.exception("Login failed")
+                login_state = LOGIN_STATE_ERROR
+            finally:
+                unlock_login()
+                try:
+                    event_loop.call_soon_threadsafe(login_done_event.set)
+                except RuntimeError:
+                    # The event loop already shut down, nobody is waiting
+                    pass
 
-        thread = threading.Thread(target=login)
-        thread.start()
+        if ENABLE_MFA:
+            login_task = asyncio.ensure_future(run_blocking(login))
+            mfa_task = asyncio.ensure_future(mfa_needed_event.wait())
 
-        print('waiting for login or mfa')
-        while True:
-            time.sleep(0.1)
-            with lock:
-                if need_mfa:
-                    return LOGIN_STATE_MFA, garmin
-                if login_state is not None:
-                    if login_state != LOGIN_STATE_SUCCESS:
-                        return LOGIN_STATE_ERROR, None
-                    else:
-                        break
+            logger.info('waiting for login or mfa')
+            done, _ = await asyncio.wait(
+                [login_task, mfa_task],
+                timeout=LOGIN_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                mfa_task.cancel()
+                logger.error("Timed out waiting for Garmin Connect login")
+                return LOGIN_STATE_ERROR, None
+            if login_task not in done:
+                # The login keeps running in the background until the code is entered
+                return LOGIN_STATE_MFA, garmin
+            mfa_task.cancel()
+        else:
+            login()
+        if login_state != LOGIN_STATE_SUCCESS:
+            return LOGIN_STATE_ERROR, None
 
     return LOGIN_STATE_SUCCESS, garmin
 
+async def wait_for_mfa_code():
+    """Wait on the event loop for the enter_mfa_code tool to supply a code"""
+    global mfa_code_future
+    mfa_code_future = event_loop.create_future()
+    mfa_needed_event.set()
+    try:
+        return await asyncio.wait_for(mfa_code_future, MFA_TIMEOUT)
+    finally:
+        mfa_needed_event.clear()
+
 def get_mfa() -> str:
     """
     Called synchronously by garminconnect.  We block until the user
     submits the code via the MCP tool below.
     """
-    global need_mfa, mfa_code
-    print("MFA required")
-    with lock:
-        need_mfa = True
-    
-    # Since we're in a thread, we need to wait synchronously
-    timeout = 1800
-    start_time = time.time()
-    while True:
-        time.sleep(0.1)
-        with lock:
-            if mfa_code:
-                code = mfa_code
-                mfa_code = None
-                need_mfa = False
-                return code
-        if time.time() - start_time > timeout:
-            raise TimeoutError("MFA timeout")
+    logger.info("MFA required")
+    # Keep the login lock so other processes don't start their own credential
+    # login and MFA challenge, but tell them why they are waiting
+    mark_login_lock(LOGIN_LOCK_MFA)
+    # We're in an executor thread, so wait synchronously on the loop's result
+    return asyncio.run_coroutine_threadsafe(wait_for_mfa_code(), event_loop).result()
 
-def main():
-    """Initialize the MCP server and register all tools"""
-    
-    # Initialize Garmin client
-    ls, garmin_client = init_api(email, password)
-    if ls == LOGIN_STATE_ERROR:
-        print("Failed to initialize Garmin Connect client. Exiting.")
-        return
-    
-    if ls == LOGIN_STATE_MFA:
-        print("Garmin Connect client initialized, but MFA is required, need user to enter code before using any tools")
-    
-    if ls == LOGIN_STATE_SUCCESS:
-        print("Garmin Connect client initialized successfully.")
-    
-    # Configure all modules with the Garmin client
-    activity_management.configure(garmin_client)
-    health_wellness.configure(garmin_client)
-    user_profile.configure(garmin_client)
-    devices.configure(garmin_client)
-    gear_management.configure(garmin_client)
-    weight_management.configure(garmin_client)
-    challenges.configure(garmin_client)
-    training.configure(garmin_client)
-    workouts.configure(garmin_client)
-    data_management.configure(garmin_client)
-    womens_health.configure(garmin_client)
-    
-    # Create the MCP app
-    app = FastMCP("Garmin Connect v1.0")
+def configure_session(garmin):
+    """Tune the Garmin client's HTTP session before it is first used.
+
+    garth already keeps a pooled keep-alive session; this only raises its pool
+    size so concurrent tool calls don't discard connections. Going through
+    garth.configure keeps the setting when garth remounts its adapter.
+    """
+    garmin.garth.configure(pool_maxsize=20)
+    if orjson is not None:
+        garmin.garth.sess.hooks["response"].append(use_orjson)
+
+def use_orjson(response, *args, **kwargs):
+    """Response hook that makes response.json() decode with orjson"""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+def _cache_activities(limit, result, now):
+    """Cache a rendered activity list, evicting expired entries for other limits"""
+    expired = [key for key, (timestamp, _) in _activities_cache.items()
+               if now - timestamp >= _ACTIVITIES_TTL]
+    for key in expired:
+        del _activities_cache[key]
+    _activities_cache[limit] = (now, result)
+
+def _format_activities(activities) -> str:
+    """Render a list of activities as a human readable summary"""
+    parts = [f"Last {len(activities)} activities:\n\n"]
+    for idx, activity in enumerate(activities, 1):
+        activity_type = activity.get('activityType')
+        parts.append(_ACTIVITY_TEMPLATE.format(
+            idx=idx,
+            name=activity.get('activityName', 'Unknown'),
+            type=activity_type.get('typeKey', 'Unknown') if activity_type is not None else 'Unknown',
+            date=activity.get('startTimeLocal', 'Unknown'),
+            aid=activity.get('activityId', 'Unknown'),
+        ))
+    return "".join(parts)
+
+def register_all_tools(app, garmin_client):
+    """Configure every tool module with the Garmin client and register its tools with the app"""
+
+    def load_module(name):
+        module = importlib.import_module(f"modules.{name}")
+        module.configure(garmin_client)
+        return module
+
+    # Modules are independent of each other, so they can be imported and
+    # configured concurrently
+    with ThreadPoolExecutor(max_workers=len(_MODULE_NAMES)) as executor:
+        modules = list(executor.map(load_module, _MODULE_NAMES))
     
-    # Register tools from all modules
-    app = activity_management.register_tools(app)
-    app = health_wellness.register_tools(app)
-    app = user_profile.register_tools(app)
-    app = devices.register_tools(app)
-    app = gear_management.register_tools(app)
-    app = weight_management.register_tools(app)
-    app = challenges.register_tools(app)
-    app = training.register_tools(app)
-    app = workouts.register_tools(app)
-    app = data_management.register_tools(app)
-    app = womens_health.register_tools(app)
+    # Register tools from all modules. This stays sequential: FastMCP's tool
+    # manager is a plain dict and registration order determines listing order.
+    # register_tools decorates tools onto the app in place.
+    for module in modules:
+        module.register_tools(app)
+
+    activity_management = modules[_MODULE_NAMES.index("activity_management")]
     
     # Add activity listing tool directly to the app
     @app.tool()
     async def list_activities(limit: int = 5) -> str:
         """List recent Garmin activities"""
         try:
-            activities = garmin_client.get_activities(0, limit)
+            now = time.monotonic()
+            hit = _activities_cache.get(limit)
+            if hit and now - hit[0] < _ACTIVITIES_TTL:
+                return hit[1]
+
+            activities = await run_blocking(garmin_client.get_activities, 0, limit)
 
             if not activities:
                 return "No activities found."
 
-            result = f"Last {len(activities)} activities:\n\n"
-            for idx, activity in enumerate(activities, 1):
-                result += f"--- Activity {idx} ---\n"
-                result += f"Activity: {activity.get('activityName', 'Unknown')}\n"
-                result += (
-                    f"Type: {activity.get('activityType', {}).get('typeKey', 'Unknown')}\n"
-                )
-                result += f"Date: {activity.get('startTimeLocal', 'Unknown')}\n"
-                result += f"ID: {activity.get('activityId', 'Unknown')}\n\n"
+            result = _format_activities(activities)
+            _cache_activities(limit, result, now)
+
+            # Clients usually ask for details of the listed activities next,
+            # so start fetching them while this response is being consumed
+            activity_ids = [a['activityId'] for a in activities if a.get('activityId')]
+            task = asyncio.create_task(activity_management.prefetch_activities(activity_ids))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
             return result
         except Exception as e:
             return f"Error retrieving activities: {str(e)}"
 
+    return app
+
+def setup_logging():
+    """Send log records to stderr through a background listener thread.
+
+    stdout carries the MCP JSON-RPC stream, so nothing else may write to it,
+    and the queue keeps the login thread and event loop from blocking on I/O.
+    """
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(sys.stderr)
+    )
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+async def serve():
+    """Initialize the MCP server, register all tools and serve over stdio"""
+    global event_loop
+    event_loop = asyncio.get_running_loop()
+    
+    # Initialize Garmin client
+    ls, garmin_client = await init_api(email, password)
+    if ls == LOGIN_STATE_ERROR:
+        logger.error("Failed to initialize Garmin Connect client. Exiting.")
+        return
+    
+    if ls == LOGIN_STATE_MFA:
+        logger.warning("Garmin Connect client initialized, but MFA is required, need user to enter code before using any tools")
+    
+    if ls == LOGIN_STATE_SUCCESS:
+        logger.info("Garmin Connect client initialized successfully.")
+
+    
+    # Create the MCP app and register all tools
+    app = FastMCP("Garmin Connect v1.0")
+    register_all_tools(app, garmin_client)
+
     if ls == LOGIN_STATE_MFA:
         # Add tool for entering MFA code
         @app.tool()
         async def enter_mfa_code(code: int) -> str:
-            global mfa_code, login_state
             """
             Enter MFA code from user to complete login
             VERY IMPORTANT: THIS MUST BE DONE ONCE BEFORE USING ANY OTHER TOOLS
@@ -233,22 +546,30 @@ def main():
             Args:
                 code (int): MFA code from user (VERY IMPORTANT, you must ask the user to enter this code)
             """
-            with lock:
-                mfa_code = code
-            start_time = time.time()
-            while True:
-                time.sleep(0.1)
-                with lock:
-                    if login_state is not None:
-                        break
-                if time.time() - start_time > 30:
-                    return "Timed out waiting for login to complete"
+            if login_done_event.is_set() and login_state == LOGIN_STATE_ERROR:
+                return "Login failed or timed out waiting for the MFA code, restart the server to try again"
+            if mfa_code_future is None or mfa_code_future.done():
+                return "An MFA code has already been submitted, waiting for login to complete"
+            mfa_code_future.set_result(code)
+            try:
+                await asyncio.wait_for(login_done_event.wait(), 30)
+            except asyncio.TimeoutError:
+                return "Timed out waiting for login to complete"
             if login_state == LOGIN_STATE_ERROR:
                 return "Failed to complete login"
             return "MFA code entered successfully."
     
-    # Run the MCP server
-    app.run()
+    # Run the MCP server on this event loop
+    await app.run_stdio_async()
+
+
+def main():
+    """Run the Garmin Connect MCP server"""
+    listener = setup_logging()
+    try:
+        asyncio.run(serve())
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
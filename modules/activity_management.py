@@ -1,12 +1,27 @@
 """
 Activity Management functions for Garmin Connect MCP Server
 """
+import asyncio
 import datetime
+import time
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
+# Recently fetched activities, keyed by ID: (timestamp, activity)
+_activity_cache = {}
+_ACTIVITY_CACHE_TTL = 60.0
+_ACTIVITY_CACHE_SIZE = 50
+# Fetches currently running, keyed by ID, so concurrent lookups share one request
+_inflight_fetches = {}
+# Only the most recent activities of a listing are prefetched, at most a few
+# at a time, to stay clear of Garmin rate limits
+_PREFETCH_LIMIT = 5
+_PREFETCH_CONCURRENCY = 5
+
 
 def configure(client):
     """Configure the module with the Garmin client instance"""
@@ -14,6 +29,63 @@ def configure(client):
     garmin_client = client
 
 
+def _get_cached_activity(activity_id):
+    """Return a cached activity if it is still fresh, otherwise None"""
+    hit = _activity_cache.get(activity_id)
+    if hit and time.monotonic() - hit[0] < _ACTIVITY_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _cache_activity(activity_id, activity):
+    """Cache an activity, evicting expired entries and then the oldest ones"""
+    now = time.monotonic()
+    expired = [key for key, (timestamp, _) in _activity_cache.items()
+               if now - timestamp >= _ACTIVITY_CACHE_TTL]
+    for key in expired:
+        del _activity_cache[key]
+    _activity_cache.pop(activity_id, None)
+    _activity_cache[activity_id] = (now, activity)
+    while len(_activity_cache) > _ACTIVITY_CACHE_SIZE:
+        del _activity_cache[next(iter(_activity_cache))]
+
+
+async def _fetch_activity(activity_id):
+    """Get an activity from the cache, joining a fetch already in flight or
+    starting a new one on the shared executor"""
+    activity = _get_cached_activity(activity_id)
+    if activity is not None:
+        return activity
+
+    fetch = _inflight_fetches.get(activity_id)
+    if fetch is None:
+        fetch = asyncio.ensure_future(run_blocking(garmin_client.get_activity, activity_id))
+        _inflight_fetches[activity_id] = fetch
+        fetch.add_done_callback(lambda _: _inflight_fetches.pop(activity_id, None))
+
+    # Shielded so one caller giving up doesn't cancel the fetch for the others
+    activity = await asyncio.shield(fetch)
+    if activity:
+        _cache_activity(activity_id, activity)
+    return activity
+
+
+async def prefetch_activities(activity_ids):
+    """Fetch the first few activities in the background so that follow-up
+    get_activity calls for them are answered from the cache"""
+    semaphore = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+    async def prefetch(activity_id):
+        async with semaphore:
+            try:
+                await _fetch_activity(activity_id)
+            except Exception:
+                # Prefetching is best effort, get_activity will retry and report errors
+                pass
+
+    await asyncio.gather(*(prefetch(activity_id) for activity_id in activity_ids[:_PREFETCH_LIMIT]))
+
+
 def register_tools(app):
     """Register all activity management tools with the MCP server app"""
     
@@ -27,7 +99,7 @@ def register_tools(app):
             activity_type: Optional activity type filter (e.g., cycling, running, swimming)
         """
         try:
-            activities = garmin_client.get_activities_by_date(start_date, end_date, activity_type)
+            activities = await run_blocking(garmin_client.get_activities_by_date, start_date, end_date, activity_type)
             if not activities:
                 return f"No activities found between {start_date} and {end_date}" + \
                        (f" for activity type '{activity_type}'" if activity_type else "")
@@ -44,7 +116,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            activities = garmin_client.get_activities_fordate(date)
+            activities = await run_blocking(garmin_client.get_activities_fordate, date)
             if not activities:
                 return f"No activities found for {date}"
             
@@ -60,7 +132,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve
         """
         try:
-            activity = garmin_client.get_activity(activity_id)
+            activity = await _fetch_activity(activity_id)
             if not activity:
                 return f"No activity found with ID {activity_id}"
             
@@ -76,7 +148,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve splits for
         """
         try:
-            splits = garmin_client.get_activity_splits(activity_id)
+            splits = await run_blocking(garmin_client.get_activity_splits, activity_id)
             if not splits:
                 return f"No splits found for activity with ID {activity_id}"
             
@@ -92,7 +164,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve typed splits for
         """
         try:
-            typed_splits = garmin_client.get_activity_typed_splits(activity_id)
+            typed_splits = await run_blocking(garmin_client.get_activity_typed_splits, activity_id)
             if not typed_splits:
                 return f"No typed splits found for activity with ID {activity_id}"
             
@@ -108,7 +180,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve split summaries for
         """
         try:
-            split_summaries = garmin_client.get_activity_split_summaries(activity_id)
+            split_summaries = await run_blocking(garmin_client.get_activity_split_summaries, activity_id)
             if not split_summaries:
                 return f"No split summaries found for activity with ID {activity_id}"
             
@@ -124,7 +196,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve weather data for
         """
         try:
-            weather = garmin_client.get_activity_weather(activity_id)
+            weather = await run_blocking(garmin_client.get_activity_weather, activity_id)
             if not weather:
                 return f"No weather data found for activity with ID {activity_id}"
             
@@ -140,7 +212,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve heart rate time zone data for
         """
         try:
-            hr_zones = garmin_client.get_activity_hr_in_timezones(activity_id)
+            hr_zones = await run_blocking(garmin_client.get_activity_hr_in_timezones, activity_id)
             if not hr_zones:
                 return f"No heart rate time zone data found for activity with ID {activity_id}"
             
@@ -156,7 +228,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve gear data for
         """
         try:
-            gear = garmin_client.get_activity_gear(activity_id)
+            gear = await run_blocking(garmin_client.get_activity_gear, activity_id)
             if not gear:
                 return f"No gear data found for activity with ID {activity_id}"
             
@@ -172,7 +244,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve exercise sets for
         """
         try:
-            exercise_sets = garmin_client.get_activity_exercise_sets(activity_id)
+            exercise_sets = await run_blocking(garmin_client.get_activity_exercise_sets, activity_id)
             if not exercise_sets:
                 return f"No exercise sets found for activity with ID {activity_id}"
             
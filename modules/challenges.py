@@ -4,6 +4,8 @@ Challenges and badges functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -25,7 +27,7 @@ def register_tools(app):
             goal_type: Type of goals to retrieve. Options: "active", "future", or "past"
         """
         try:
-            goals = garmin_client.get_goals(goal_type)
+            goals = await run_blocking(garmin_client.get_goals, goal_type)
             if not goals:
                 return f"No {goal_type} goals found."
             return goals
@@ -36,7 +38,7 @@ def register_tools(app):
     async def get_personal_record() -> str:
         """Get personal records for user"""
         try:
-            records = garmin_client.get_personal_record()
+            records = await run_blocking(garmin_client.get_personal_record)
             if not records:
                 return "No personal records found."
             return records
@@ -47,7 +49,7 @@ def register_tools(app):
     async def get_earned_badges() -> str:
         """Get earned badges for user"""
         try:
-            badges = garmin_client.get_earned_badges()
+            badges = await run_blocking(garmin_client.get_earned_badges)
             if not badges:
                 return "No earned badges found."
             return badges
@@ -63,7 +65,7 @@ def register_tools(app):
             limit: Maximum number of challenges to retrieve
         """
         try:
-            challenges = garmin_client.get_adhoc_challenges(start, limit)
+            challenges = await run_blocking(garmin_client.get_adhoc_challenges, start, limit)
             if not challenges:
                 return "No adhoc challenges found."
             return challenges
@@ -79,7 +81,7 @@ def register_tools(app):
             limit: Maximum number of challenges to retrieve
         """
         try:
-            challenges = garmin_client.get_available_badge_challenges(start, limit)
+            challenges = await run_blocking(garmin_client.get_available_badge_challenges, start, limit)
             if not challenges:
                 return "No available badge challenges found."
             return challenges
@@ -95,7 +97,7 @@ def register_tools(app):
             limit: Maximum number of challenges to retrieve
         """
         try:
-            challenges = garmin_client.get_badge_challenges(start, limit)
+            challenges = await run_blocking(garmin_client.get_badge_challenges, start, limit)
             if not challenges:
                 return "No badge challenges found."
             return challenges
@@ -111,7 +113,7 @@ def register_tools(app):
             limit: Maximum number of challenges to retrieve
         """
         try:
-            challenges = garmin_client.get_non_completed_badge_challenges(start, limit)
+            challenges = await run_blocking(garmin_client.get_non_completed_badge_challenges, start, limit)
             if not challenges:
                 return "No non-completed badge challenges found."
             return challenges
@@ -122,7 +124,7 @@ def register_tools(app):
     async def get_race_predictions() -> str:
         """Get race predictions for user"""
         try:
-            predictions = garmin_client.get_race_predictions()
+            predictions = await run_blocking(garmin_client.get_race_predictions)
             if not predictions:
                 return "No race predictions found."
             return predictions
@@ -138,7 +140,8 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            challenges = garmin_client.get_inprogress_virtual_challenges(
+            challenges = await run_blocking(
+                garmin_client.get_inprogress_virtual_challenges,
                 start_date, end_date
             )
             if not challenges:
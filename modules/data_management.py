@@ -4,6 +4,8 @@ Data management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -51,7 +53,8 @@ def register_tools(app):
             bmi: Body Mass Index
         """
         try:
-            result = garmin_client.add_body_composition(
+            result = await run_blocking(
+                garmin_client.add_body_composition,
                 date,
                 weight=weight,
                 percent_fat=percent_fat,
@@ -86,7 +89,8 @@ def register_tools(app):
             notes: Optional notes
         """
         try:
-            result = garmin_client.set_blood_pressure(
+            result = await run_blocking(
+                garmin_client.set_blood_pressure,
                 systolic, diastolic, pulse, notes=notes
             )
             return result
@@ -107,7 +111,8 @@ def register_tools(app):
             timestamp: Timestamp in YYYY-MM-DDThh:mm:ss.sss format
         """
         try:
-            result = garmin_client.add_hydration_data(
+            result = await run_blocking(
+                garmin_client.add_hydration_data,
                 value_in_ml=value_in_ml,
                 cdate=cdate,
                 timestamp=timestamp
@@ -4,6 +4,8 @@ Device-related functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -21,7 +23,7 @@ def register_tools(app):
     async def get_devices() -> str:
         """Get all Garmin devices associated with the user account"""
         try:
-            devices = garmin_client.get_devices()
+            devices = await run_blocking(garmin_client.get_devices)
             if not devices:
                 return "No devices found."
             return devices
@@ -32,7 +34,7 @@ def register_tools(app):
     async def get_device_last_used() -> str:
         """Get information about the last used Garmin device"""
         try:
-            device = garmin_client.get_device_last_used()
+            device = await run_blocking(garmin_client.get_device_last_used)
             if not device:
                 return "No last used device found."
             return device
@@ -47,7 +49,7 @@ def register_tools(app):
             device_id: Device ID
         """
         try:
-            settings = garmin_client.get_device_settings(device_id)
+            settings = await run_blocking(garmin_client.get_device_settings, device_id)
             if not settings:
                 return f"No settings found for device ID {device_id}."
             return settings
@@ -58,7 +60,7 @@ def register_tools(app):
     async def get_primary_training_device() -> str:
         """Get information about the primary training device"""
         try:
-            device = garmin_client.get_primary_training_device()
+            device = await run_blocking(garmin_client.get_primary_training_device)
             if not device:
                 return "No primary training device found."
             return device
@@ -74,7 +76,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            solar_data = garmin_client.get_device_solar_data(device_id, date)
+            solar_data = await run_blocking(garmin_client.get_device_solar_data, device_id, date)
             if not solar_data:
                 return f"No solar data found for device ID {device_id} on {date}."
             return solar_data
@@ -85,7 +87,7 @@ def register_tools(app):
     async def get_device_alarms() -> str:
         """Get alarms from all Garmin devices"""
         try:
-            alarms = garmin_client.get_device_alarms()
+            alarms = await run_blocking(garmin_client.get_device_alarms)
             if not alarms:
                 return "No device alarms found."
             return alarms
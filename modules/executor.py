@@ -0,0 +1,15 @@
+"""
+Shared thread pool for blocking Garmin Connect calls made from async MCP tools
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Bounded so concurrent tool invocations don't spawn unbounded threads
+_executor = ThreadPoolExecutor(max_workers=8)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared executor without stalling the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
@@ -4,6 +4,8 @@ Gear management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -25,7 +27,7 @@ def register_tools(app):
             user_profile_id: User profile ID (can be obtained from get_device_last_used)
         """
         try:
-            gear = garmin_client.get_gear(user_profile_id)
+            gear = await run_blocking(garmin_client.get_gear, user_profile_id)
             if not gear:
                 return "No gear found."
             return gear
@@ -40,7 +42,7 @@ def register_tools(app):
             user_profile_id: User profile ID (can be obtained from get_device_last_used)
         """
         try:
-            defaults = garmin_client.get_gear_defaults(user_profile_id)
+            defaults = await run_blocking(garmin_client.get_gear_defaults, user_profile_id)
             if not defaults:
                 return "No gear defaults found."
             return defaults
@@ -55,7 +57,7 @@ def register_tools(app):
             gear_uuid: UUID of the gear item
         """
         try:
-            stats = garmin_client.get_gear_stats(gear_uuid)
+            stats = await run_blocking(garmin_client.get_gear_stats, gear_uuid)
             if not stats:
                 return f"No stats found for gear with UUID {gear_uuid}."
             return stats
@@ -4,6 +4,8 @@ Health & Wellness Data functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -25,7 +27,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            stats = garmin_client.get_stats(date)
+            stats = await run_blocking(garmin_client.get_stats, date)
             if not stats:
                 return f"No stats found for {date}"
             
@@ -41,7 +43,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            summary = garmin_client.get_user_summary(date)
+            summary = await run_blocking(garmin_client.get_user_summary, date)
             if not summary:
                 return f"No user summary found for {date}"
             
@@ -59,11 +61,11 @@ def register_tools(app):
         """
         try:
             if end_date:
-                composition = garmin_client.get_body_composition(start_date, end_date)
+                composition = await run_blocking(garmin_client.get_body_composition, start_date, end_date)
                 if not composition:
                     return f"No body composition data found between {start_date} and {end_date}"
             else:
-                composition = garmin_client.get_body_composition(start_date)
+                composition = await run_blocking(garmin_client.get_body_composition, start_date)
                 if not composition:
                     return f"No body composition data found for {start_date}"
             
@@ -79,7 +81,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            data = garmin_client.get_stats_and_body(date)
+            data = await run_blocking(garmin_client.get_stats_and_body, date)
             if not data:
                 return f"No stats and body composition data found for {date}"
             
@@ -95,7 +97,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            steps_data = garmin_client.get_steps_data(date)
+            steps_data = await run_blocking(garmin_client.get_steps_data, date)
             if not steps_data:
                 return f"No steps data found for {date}"
             
@@ -112,7 +114,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            steps_data = garmin_client.get_daily_steps(start_date, end_date)
+            steps_data = await run_blocking(garmin_client.get_daily_steps, start_date, end_date)
             if not steps_data:
                 return f"No daily steps data found between {start_date} and {end_date}"
             
@@ -128,7 +130,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            readiness = garmin_client.get_training_readiness(date)
+            readiness = await run_blocking(garmin_client.get_training_readiness, date)
             if not readiness:
                 return f"No training readiness data found for {date}"
             
@@ -145,7 +147,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            battery_data = garmin_client.get_body_battery(start_date, end_date)
+            battery_data = await run_blocking(garmin_client.get_body_battery, start_date, end_date)
             if not battery_data:
                 return f"No body battery data found between {start_date} and {end_date}"
             
@@ -161,7 +163,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            events = garmin_client.get_body_battery_events(date)
+            events = await run_blocking(garmin_client.get_body_battery_events, date)
             if not events:
                 return f"No body battery events found for {date}"
             
@@ -178,7 +180,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            bp_data = garmin_client.get_blood_pressure(start_date, end_date)
+            bp_data = await run_blocking(garmin_client.get_blood_pressure, start_date, end_date)
             if not bp_data:
                 return f"No blood pressure data found between {start_date} and {end_date}"
             
@@ -194,7 +196,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            floors_data = garmin_client.get_floors(date)
+            floors_data = await run_blocking(garmin_client.get_floors, date)
             if not floors_data:
                 return f"No floors data found for {date}"
             
@@ -210,7 +212,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            status = garmin_client.get_training_status(date)
+            status = await run_blocking(garmin_client.get_training_status, date)
             if not status:
                 return f"No training status data found for {date}"
             
@@ -226,7 +228,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            rhr_data = garmin_client.get_rhr_day(date)
+            rhr_data = await run_blocking(garmin_client.get_rhr_day, date)
             if not rhr_data:
                 return f"No resting heart rate data found for {date}"
             
@@ -242,7 +244,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            hr_data = garmin_client.get_heart_rates(date)
+            hr_data = await run_blocking(garmin_client.get_heart_rates, date)
             if not hr_data:
                 return f"No heart rate data found for {date}"
             
@@ -258,7 +260,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            hydration_data = garmin_client.get_hydration_data(date)
+            hydration_data = await run_blocking(garmin_client.get_hydration_data, date)
             if not hydration_data:
                 return f"No hydration data found for {date}"
             
@@ -274,7 +276,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            sleep_data = garmin_client.get_sleep_data(date)
+            sleep_data = await run_blocking(garmin_client.get_sleep_data, date)
             if not sleep_data:
                 return f"No sleep data found for {date}"
             
@@ -290,7 +292,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            stress_data = garmin_client.get_stress_data(date)
+            stress_data = await run_blocking(garmin_client.get_stress_data, date)
             if not stress_data:
                 return f"No stress data found for {date}"
             
@@ -306,7 +308,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            respiration_data = garmin_client.get_respiration_data(date)
+            respiration_data = await run_blocking(garmin_client.get_respiration_data, date)
             if not respiration_data:
                 return f"No respiration data found for {date}"
             
@@ -322,7 +324,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            spo2_data = garmin_client.get_spo2_data(date)
+            spo2_data = await run_blocking(garmin_client.get_spo2_data, date)
             if not spo2_data:
                 return f"No SpO2 data found for {date}"
             
@@ -338,7 +340,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            stress_data = garmin_client.get_all_day_stress(date)
+            stress_data = await run_blocking(garmin_client.get_all_day_stress, date)
             if not stress_data:
                 return f"No all-day stress data found for {date}"
             
@@ -354,7 +356,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            events = garmin_client.get_all_day_events(date)
+            events = await run_blocking(garmin_client.get_all_day_events, date)
             if not events:
                 return f"No daily wellness events found for {date}"
             
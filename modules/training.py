@@ -4,6 +4,8 @@ Training and performance functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -29,7 +31,8 @@ def register_tools(app):
             metric: Metric to get progress for (e.g., "elevationGain", "duration", "distance", "movingDuration")
         """
         try:
-            summary = garmin_client.get_progress_summary_between_dates(
+            summary = await run_blocking(
+                garmin_client.get_progress_summary_between_dates,
                 start_date, end_date, metric
             )
             if not summary:
@@ -47,7 +50,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            hill_score = garmin_client.get_hill_score(start_date, end_date)
+            hill_score = await run_blocking(garmin_client.get_hill_score, start_date, end_date)
             if not hill_score:
                 return f"No hill score data found between {start_date} and {end_date}."
             return hill_score
@@ -63,7 +66,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            endurance_score = garmin_client.get_endurance_score(start_date, end_date)
+            endurance_score = await run_blocking(garmin_client.get_endurance_score, start_date, end_date)
             if not endurance_score:
                 return f"No endurance score data found between {start_date} and {end_date}."
             return endurance_score
@@ -78,7 +81,7 @@ def register_tools(app):
             activity_id: ID of the activity to retrieve training effect for
         """
         try:
-            effect = garmin_client.get_training_effect(activity_id)
+            effect = await run_blocking(garmin_client.get_training_effect, activity_id)
             if not effect:
                 return f"No training effect data found for activity with ID {activity_id}."
             return effect
@@ -93,7 +96,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            metrics = garmin_client.get_max_metrics(date)
+            metrics = await run_blocking(garmin_client.get_max_metrics, date)
             if not metrics:
                 return f"No max metrics data found for {date}."
             return metrics
@@ -108,7 +111,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            hrv_data = garmin_client.get_hrv_data(date)
+            hrv_data = await run_blocking(garmin_client.get_hrv_data, date)
             if not hrv_data:
                 return f"No HRV data found for {date}."
             return hrv_data
@@ -123,7 +126,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            fitness_age = garmin_client.get_fitnessage_data(date)
+            fitness_age = await run_blocking(garmin_client.get_fitnessage_data, date)
             if not fitness_age:
                 return f"No fitness age data found for {date}."
             return fitness_age
@@ -138,7 +141,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            result = garmin_client.request_reload(date)
+            result = await run_blocking(garmin_client.request_reload, date)
             return result
         except Exception as e:
             return f"Error requesting data reload: {str(e)}"
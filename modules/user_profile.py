@@ -4,6 +4,8 @@ User Profile functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -21,7 +23,7 @@ def register_tools(app):
     async def get_full_name() -> str:
         """Get user's full name from profile"""
         try:
-            full_name = garmin_client.get_full_name()
+            full_name = await run_blocking(garmin_client.get_full_name)
             return full_name
         except Exception as e:
             return f"Error retrieving user's full name: {str(e)}"
@@ -30,7 +32,7 @@ def register_tools(app):
     async def get_unit_system() -> str:
         """Get user's preferred unit system from profile"""
         try:
-            unit_system = garmin_client.get_unit_system()
+            unit_system = await run_blocking(garmin_client.get_unit_system)
             return unit_system
         except Exception as e:
             return f"Error retrieving unit system: {str(e)}"
@@ -39,7 +41,7 @@ def register_tools(app):
     async def get_user_profile() -> str:
         """Get user profile information"""
         try:
-            profile = garmin_client.get_user_profile()
+            profile = await run_blocking(garmin_client.get_user_profile)
             if not profile:
                 return "No user profile information found."
             return profile
@@ -50,7 +52,7 @@ def register_tools(app):
     async def get_userprofile_settings() -> str:
         """Get user profile settings"""
         try:
-            settings = garmin_client.get_userprofile_settings()
+            settings = await run_blocking(garmin_client.get_userprofile_settings)
             if not settings:
                 return "No user profile settings found."
             return settings
@@ -4,6 +4,8 @@ Weight management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -26,7 +28,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            weigh_ins = garmin_client.get_weigh_ins(start_date, end_date)
+            weigh_ins = await run_blocking(garmin_client.get_weigh_ins, start_date, end_date)
             if not weigh_ins:
                 return f"No weight measurements found between {start_date} and {end_date}."
             return weigh_ins
@@ -41,7 +43,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            weigh_ins = garmin_client.get_daily_weigh_ins(date)
+            weigh_ins = await run_blocking(garmin_client.get_daily_weigh_ins, date)
             if not weigh_ins:
                 return f"No weight measurements found for {date}."
             return weigh_ins
@@ -57,7 +59,7 @@ def register_tools(app):
             delete_all: Whether to delete all measurements for the day
         """
         try:
-            result = garmin_client.delete_weigh_ins(date, delete_all=delete_all)
+            result = await run_blocking(garmin_client.delete_weigh_ins, date, delete_all=delete_all)
             return result
         except Exception as e:
             return f"Error deleting weight measurements: {str(e)}"
@@ -71,7 +73,7 @@ def register_tools(app):
             unit_key: Unit of weight ('kg' or 'lb')
         """
         try:
-            result = garmin_client.add_weigh_in(weight=weight, unitKey=unit_key)
+            result = await run_blocking(garmin_client.add_weigh_in, weight=weight, unitKey=unit_key)
             return result
         except Exception as e:
             return f"Error adding weight measurement: {str(e)}"
@@ -98,7 +100,8 @@ def register_tools(app):
                 date_timestamp = now.strftime('%Y-%m-%dT%H:%M:%S')
                 gmt_timestamp = now.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
                 
-            result = garmin_client.add_weigh_in_with_timestamps(
+            result = await run_blocking(
+                garmin_client.add_weigh_in_with_timestamps,
                 weight=weight,
                 unitKey=unit_key,
                 dateTimestamp=date_timestamp,
@@ -4,6 +4,8 @@ Women's health functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -21,7 +23,7 @@ def register_tools(app):
     async def get_pregnancy_summary() -> str:
         """Get pregnancy summary data"""
         try:
-            summary = garmin_client.get_pregnancy_summary()
+            summary = await run_blocking(garmin_client.get_pregnancy_summary)
             if not summary:
                 return "No pregnancy summary data found."
             return summary
@@ -36,7 +38,7 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            data = garmin_client.get_menstrual_data_for_date(date)
+            data = await run_blocking(garmin_client.get_menstrual_data_for_date, date)
             if not data:
                 return f"No menstrual data found for {date}."
             return data
@@ -52,7 +54,7 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            data = garmin_client.get_menstrual_calendar_data(start_date, end_date)
+            data = await run_blocking(garmin_client.get_menstrual_calendar_data, start_date, end_date)
             if not data:
                 return f"No menstrual calendar data found between {start_date} and {end_date}."
             return data
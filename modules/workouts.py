@@ -4,6 +4,8 @@ Workout-related functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules.executor import run_blocking
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -21,7 +23,7 @@ def register_tools(app):
     async def get_workouts() -> str:
         """Get all workouts"""
         try:
-            workouts = garmin_client.get_workouts()
+            workouts = await run_blocking(garmin_client.get_workouts)
             if not workouts:
                 return "No workouts found."
             return workouts
@@ -36,7 +38,7 @@ def register_tools(app):
             workout_id: ID of the workout to retrieve
         """
         try:
-            workout = garmin_client.get_workout_by_id(workout_id)
+            workout = await run_blocking(garmin_client.get_workout_by_id, workout_id)
             if not workout:
                 return f"No workout found with ID {workout_id}."
             return workout
@@ -51,7 +53,7 @@ def register_tools(app):
             workout_id: ID of the workout to download
         """
         try:
-            workout_data = garmin_client.download_workout(workout_id)
+            workout_data = await run_blocking(garmin_client.download_workout, workout_id)
             if not workout_data:
                 return f"No workout data found for workout with ID {workout_id}."
             
@@ -68,7 +70,7 @@ def register_tools(app):
             workout_json: JSON string containing workout data
         """
         try:
-            result = garmin_client.upload_workout(workout_json)
+            result = await run_blocking(garmin_client.upload_workout, workout_json)
             return result
         except Exception as e:
             return f"Error uploading workout: {str(e)}"
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the offline MCP server tests
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class FakeGarth:
+    """Stand-in for garth.Client that keeps its OAuth2 token in a JSON file"""
+
+    def __init__(self, expires_at):
+        self.oauth2_token = SimpleNamespace(expires_at=expires_at)
+        self.refreshes = 0
+
+    def dump(self, path):
+        with open(os.path.join(path, "oauth2_token.json"), "w") as token_file:
+            json.dump({"expires_at": self.oauth2_token.expires_at}, token_file)
+
+    def load(self, path):
+        with open(os.path.join(path, "oauth2_token.json")) as token_file:
+            self.oauth2_token = SimpleNamespace(**json.load(token_file))
+
+    def dumps(self):
+        return json.dumps({"expires_at": self.oauth2_token.expires_at})
+
+    def loads(self, data):
+        self.oauth2_token = SimpleNamespace(**json.loads(data))
+
+    def refresh_oauth2(self):
+        self.refreshes += 1
+        self.oauth2_token = SimpleNamespace(expires_at=time.time() + 3600)
+
+
+@pytest.fixture
+def fake_garmin():
+    """Factory for Garmin clients backed by FakeGarth"""
+    return lambda expires_at: SimpleNamespace(garth=FakeGarth(expires_at))
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """The server module with its token store pointed at a temporary directory"""
+    monkeypatch.setenv("GARMINTOKENS", str(tmp_path / "garminconnect"))
+    monkeypatch.setenv("GARMINTOKENS_BASE64", str(tmp_path / "garminconnect_base64"))
+    import garmin_mcp_server
+    server = importlib.reload(garmin_mcp_server)
+    yield server
+    server.unlock_login()
+
+
+@pytest.fixture
+def held_login_lock(server):
+    """Hold the login lock the way another server process would"""
+    fcntl = pytest.importorskip("fcntl")
+    lock_fd = os.open(server.tokenstore + ".login.lock", os.O_CREAT | os.O_RDWR)
+    fcntl.flock(lock_fd, fcntl.LOCK_EX)
+    yield
+    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    os.close(lock_fd)
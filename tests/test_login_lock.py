@@ -0,0 +1,78 @@
+"""
+Tests for the cross-process login lock of the MCP server
+These run without network access against a temporary GARMINTOKENS directory
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def test_lock_login_times_out_while_held_elsewhere(server, held_login_lock):
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        server.lock_login(timeout=0.2)
+    assert time.monotonic() - start < 2
+
+
+def test_lock_login_reports_uncontended_lock(server):
+    assert server.lock_login(timeout=0.2) is False
+    server.unlock_login()
+    assert server.lock_login(timeout=0.2) is False
+
+
+def test_init_api_gives_up_while_lock_held_elsewhere(server, held_login_lock, monkeypatch):
+    monkeypatch.setattr(server, "LOGIN_TIMEOUT", 0.5)
+
+    start = time.monotonic()
+    ls, garmin = asyncio.run(server.init_api("user@example.com", "password"))
+
+    assert (ls, garmin) == (server.LOGIN_STATE_ERROR, None)
+    assert time.monotonic() - start < 5
+
+
+def test_get_mfa_keeps_login_lock_and_tells_waiters_why(server):
+    async def enter_code_while_waiting():
+        server.event_loop = asyncio.get_running_loop()
+        server.lock_login(timeout=0.2)
+        code = asyncio.ensure_future(server.run_blocking(server.get_mfa))
+        await server.mfa_needed_event.wait()
+
+        # Other processes keep waiting instead of starting their own MFA login
+        with pytest.raises(TimeoutError, match="completing MFA"):
+            await server.run_blocking(server.lock_login, 0.2)
+
+        server.mfa_code_future.set_result("123456")
+        return await code
+
+    assert asyncio.run(enter_code_while_waiting()) == "123456"
+
+
+def test_init_api_rechecks_stored_tokens_after_taking_lock(server, monkeypatch):
+    attempts = []
+
+    def login_with_stored_tokens():
+        # Another process saves its tokens right after our first attempt
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise FileNotFoundError(server.tokenstore)
+        return "garmin"
+
+    monkeypatch.setattr(server, "login_with_stored_tokens", login_with_stored_tokens)
+
+    assert asyncio.run(server.init_api(None, None)) == (server.LOGIN_STATE_SUCCESS, "garmin")
+    assert len(attempts) == 2
+    assert server._login_lock_fd is None
+
+
+def test_init_api_treats_corrupt_base64_tokens_as_missing(server):
+    server.write_token_file(server.tokenstore_base64, "not base64!" * 60)
+
+    with pytest.raises(FileNotFoundError):
+        server.login_with_stored_tokens()
+    # Without credentials this ends in a clean error instead of a crash
+    assert asyncio.run(server.init_api(None, None)) == (server.LOGIN_STATE_ERROR, None)
@@ -0,0 +1,55 @@
+"""
+Tests for refreshing stale OAuth tokens in the token store of the MCP server
+These run without network access against a temporary GARMINTOKENS directory
+"""
+
+import os
+import time
+
+
+def test_refresh_tokens_refreshes_and_saves_stale_tokens(server, fake_garmin):
+    garmin = fake_garmin(time.time() - 10)
+
+    server.refresh_tokens(garmin, server.tokenstore, False)
+
+    assert garmin.garth.refreshes == 1
+    stored = fake_garmin(0)
+    stored.garth.load(server.tokenstore)
+    assert stored.garth.oauth2_token.expires_at == garmin.garth.oauth2_token.expires_at
+    assert os.path.exists(server.tokenstore_base64)
+
+
+def test_refresh_tokens_reuses_tokens_refreshed_by_another_process(server, fake_garmin):
+    os.makedirs(server.tokenstore)
+    fresh = fake_garmin(time.time() + 3600).garth
+    fresh.dump(server.tokenstore)
+    garmin = fake_garmin(time.time() - 10)
+
+    server.refresh_tokens(garmin, server.tokenstore, False)
+
+    assert garmin.garth.refreshes == 0
+    assert garmin.garth.oauth2_token.expires_at == fresh.oauth2_token.expires_at
+
+
+def test_refresh_tokens_gives_up_while_lock_held_elsewhere(server, fake_garmin, held_login_lock, monkeypatch):
+    monkeypatch.setattr(server, "LOGIN_TIMEOUT", 0.2)
+    garmin = fake_garmin(time.time() - 10)
+
+    server.refresh_tokens(garmin, server.tokenstore, False)
+
+    assert garmin.garth.refreshes == 0
+    assert not os.path.exists(server.tokenstore)
+
+
+def test_refresh_tokens_rereads_only_the_base64_source(server, fake_garmin):
+    # Stale directory tokens are why the client fell back to the base64 file
+    os.makedirs(server.tokenstore)
+    fake_garmin(time.time() - 10).garth.dump(server.tokenstore)
+    fresh = fake_garmin(time.time() + 3600).garth
+    server.write_token_file(server.tokenstore_base64, fresh.dumps())
+    garmin = fake_garmin(time.time() - 10)
+
+    server.refresh_tokens(garmin, server.tokenstore_base64, True)
+
+    assert garmin.garth.refreshes == 0
+    assert garmin.garth.oauth2_token.expires_at == fresh.oauth2_token.expires_at
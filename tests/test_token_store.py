@@ -0,0 +1,27 @@
+"""
+Tests for writing the token store of the MCP server
+These run without network access against a temporary GARMINTOKENS directory
+"""
+
+import os
+
+
+def test_write_token_file_replaces_contents(server, tmp_path):
+    server.write_token_file(server.tokenstore_base64, "first")
+    server.write_token_file(server.tokenstore_base64, "second")
+
+    with open(server.tokenstore_base64) as token_file:
+        assert token_file.read() == "second"
+    # No temp files are left behind next to the token file
+    leftovers = [name for name in os.listdir(tmp_path) if name != "garminconnect_base64.lock"]
+    assert leftovers == ["garminconnect_base64"]
+
+
+def test_dump_tokens_replaces_token_files(server, fake_garmin):
+    server.dump_tokens(fake_garmin(1), server.tokenstore)
+    server.dump_tokens(fake_garmin(2), server.tokenstore)
+
+    assert os.listdir(server.tokenstore) == ["oauth2_token.json"]
+    stored = fake_garmin(0)
+    stored.garth.load(server.tokenstore)
+    assert stored.garth.oauth2_token.expires_at == 2